@@ -39,14 +39,15 @@ LINE_STYLES_TO_MATPLOTLIB = {
     "longdashdot": "loosely dashdotted",
 }
 
+# matplotlib kwarg -> (generic parent key, generic child key, flat generic key)
 SCATTER_KWARGS_LOOKUPS = {
-    "ls": ("line", "dash"),
-    "lw": ("line", "width"),
-    "color": ("line", "color"),
-    "marker": ("marker", "symbol"),
-    "mfc": ("marker", "color"),
-    "mec": ("marker", "color"),
-    "ms": ("marker", "size"),
+    "ls": ("line", "dash", "line_dash"),
+    "lw": ("line", "width", "line_width"),
+    "color": ("line", "color", "line_color"),
+    "marker": ("marker", "symbol", "marker_symbol"),
+    "mfc": ("marker", "color", "marker_color"),
+    "mec": ("marker", "color", "marker_color"),
+    "ms": ("marker", "size", "marker_size"),
 }
 
 
@@ -100,8 +101,8 @@ def generic_trace_to_matplotlib(trace, antialiased=True):
         if has_facecolor:
             subtraces = subdivide_mesh_by_facecolor(trace)
         for ind, subtrace in enumerate(subtraces):
-            x, y, z = np.array([subtrace[k] for k in "xyz"], dtype=float)
-            triangles = np.array([subtrace[k] for k in "ijk"]).T
+            x, y, z = (np.asarray(subtrace[k], dtype=float) for k in "xyz")
+            triangles = np.column_stack([subtrace[k] for k in "ijk"])
             tr_mesh = {
                 "constructor": "plot_trisurf",
                 "args": (x, y, z),
@@ -119,16 +120,16 @@ def generic_trace_to_matplotlib(trace, antialiased=True):
                 tr_mesh["kwargs"]["label"] = "_nolegend_"
             traces_mpl.append(tr_mesh)
     elif "scatter" in trace["type"]:
-        props = {
-            k: trace.get(v[0], {}).get(v[1], trace.get("_".join(v), None))
-            for k, v in SCATTER_KWARGS_LOOKUPS.items()
-        }
+        parents = {"line": trace.get("line", {}), "marker": trace.get("marker", {})}
+        props = {}
+        for k, (parent, child, flat) in SCATTER_KWARGS_LOOKUPS.items():
+            props[k] = parents[parent].get(child, trace.get(flat, None))
         coords_str = "xyz"
         if trace["type"] == "scatter":
             coords_str = "xy"
             # marker size is proportional to area, not radius like generic
             props["ms"] = np.pi * props["ms"] ** 2
-        coords = np.array([trace[k] for k in coords_str], dtype=float)
+        coords = tuple(np.asarray(trace[k], dtype=float) for k in coords_str)
         if isinstance(props["ms"], (list, tuple, np.ndarray)):
             traces_mpl.append(
                 {
@@ -200,6 +201,28 @@ def generic_trace_to_matplotlib(trace, antialiased=True):
     return traces_mpl
 
 
+def trace_inputs_equal(tr1, tr2, key):
+    """Return True if the `args` or `kwargs` of two matplotlib traces are equal"""
+    inp1, inp2 = tr1.get(key, ()), tr2.get(key, ())
+    if isinstance(inp1, dict):
+        if inp1.keys() != inp2.keys():
+            return False
+        inp1, inp2 = list(inp1.values()), [inp2[k] for k in inp1]
+    if len(inp1) != len(inp2):
+        return False
+    for val1, val2 in zip(inp1, inp2):
+        if isinstance(val1, np.ndarray) or isinstance(val2, np.ndarray):
+            if not np.array_equal(val1, val2):
+                return False
+        else:
+            try:
+                if not bool(val1 == val2):
+                    return False
+            except ValueError:  # e.g. sequences of arrays
+                return False
+    return True
+
+
 def extract_axis_from_row_col(fig, row, col):
     "Return axis from row and col values"
 
@@ -329,14 +352,30 @@ def display_matplotlib(
                 if axes[row_col_num].name == "3d":
                     axes[row_col_num].set_box_aspect((1, 1, 1))
 
+    # traces and corresponding artists of the currently drawn frame
+    drawn = {"traces": [], "artists": []}
+
+    def add_trace(tr):
+        ax = axes[(tr["row"], tr["col"])]
+        constructor = tr["constructor"]
+        trace = getattr(ax, constructor)(*tr.get("args", ()), **tr.get("kwargs", {}))
+        if constructor == "plot_trisurf":
+            # 'Poly3DCollection' object has no attribute '_edgecolors2d'
+            for arg in ("face", "edge"):
+                color = getattr(trace, f"_{arg}color3d", None)
+                color = (  # for mpl version <3.3.3
+                    getattr(trace, f"_{arg}colors3d", None) if color is None else color
+                )
+                setattr(trace, f"_{arg}colors2d", color)
+        return trace
+
     def draw_frame(frame_ind):
         count_with_labels = {}
         handler_map = {}
+        drawn["traces"] = frames[frame_ind]["data"]
+        drawn["artists"] = []
         for tr in frames[frame_ind]["data"]:
             row_col_num = (tr["row"], tr["col"])
-            ax = axes[row_col_num]
-            constructor = tr["constructor"]
-            args = tr.get("args", ())
             kwargs = tr.get("kwargs", {})
             if frame_ind == 0:
                 if row_col_num not in count_with_labels:
@@ -344,19 +383,10 @@ def display_matplotlib(
                 label = kwargs.get("label", "_")
                 if label and not label.startswith("_"):
                     count_with_labels[row_col_num] += 1
-            trace = getattr(ax, constructor)(*args, **kwargs)
+            trace = add_trace(tr)
+            drawn["artists"].append(trace)
             if "legend_handler" in tr:
                 handler_map[trace] = tr["legend_handler"]
-            if constructor == "plot_trisurf":
-                # 'Poly3DCollection' object has no attribute '_edgecolors2d'
-                for arg in ("face", "edge"):
-                    color = getattr(trace, f"_{arg}color3d", None)
-                    color = (  # for mpl version <3.3.3
-                        getattr(trace, f"_{arg}colors3d", None)
-                        if color is None
-                        else color
-                    )
-                    setattr(trace, f"_{arg}colors2d", color)
         for row_col_num, ax in axes.items():
             count = count_with_labels.get(row_col_num, 0)
             if ax.name == "3d":
@@ -378,11 +408,62 @@ def display_matplotlib(
             else:
                 ax.legend(loc="best")
 
-    def animate(ind):  # pragma: no cover
-        for ax in axes.values():
-            ax.clear()
-        draw_frame(ind)
-        return list(axes.values())
+    def update_frame(frame_ind):
+        """Update the drawn artists in place with the traces of another frame. Only
+        artists with changed inputs are modified, lines and 2D markers get new data,
+        other artists (e.g. meshes which need new shading) are recreated. Returns the
+        modified artists, or `None` if the traces do not match the drawn ones or an
+        artist without explicit color would need to be recreated."""
+        traces = frames[frame_ind]["data"]
+        if len(traces) != len(drawn["traces"]) or any(
+            (tr["constructor"], tr["row"], tr["col"])
+            != (tr_old["constructor"], tr_old["row"], tr_old["col"])
+            for tr, tr_old in zip(traces, drawn["traces"])
+        ):
+            return None
+        changed, changed_axes = [], set()
+        for ind, (tr, tr_old) in enumerate(zip(traces, drawn["traces"])):
+            same_kwargs = trace_inputs_equal(tr, tr_old, "kwargs")
+            if same_kwargs and trace_inputs_equal(tr, tr_old, "args"):
+                continue
+            ax = axes[(tr["row"], tr["col"])]
+            artist = drawn["artists"][ind]
+            if tr["constructor"] == "plot" and same_kwargs and len(artist) == 1:
+                if ax.name == "3d":
+                    artist[0].set_data_3d(*tr["args"])
+                else:
+                    artist[0].set_data(*tr["args"])
+            elif tr["constructor"] == "scatter" and same_kwargs and ax.name != "3d":
+                artist.set_offsets(np.column_stack(tr["args"]))
+            else:
+                kwargs = tr.get("kwargs", {})
+                if (
+                    tr["constructor"] != "text"
+                    and kwargs.get("color", kwargs.get("c")) is None
+                ):
+                    # a recreated artist without explicit color would take the next
+                    # color of the axes property cycle, which only a redraw resets
+                    return None
+                for art in artist if isinstance(artist, list) else [artist]:
+                    art.remove()
+                artist = drawn["artists"][ind] = add_trace(tr)
+            changed.extend(artist if isinstance(artist, list) else [artist])
+            changed_axes.add(ax)
+        drawn["traces"] = traces
+        for ax in changed_axes:
+            if ax.name != "3d":
+                ax.relim()
+                ax.autoscale_view()
+        return changed
+
+    def animate(ind):
+        changed = update_frame(ind)
+        if changed is None:
+            for ax in axes.values():
+                ax.clear()
+            draw_frame(ind)
+            return list(axes.values())
+        return changed
 
     anim = None
     if len(frames) == 1:
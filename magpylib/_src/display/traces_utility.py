@@ -617,23 +617,42 @@ def group_traces(*traces):
     return traces
 
 
+@lru_cache(maxsize=32)
+def get_mesh_facecolor_partition(facecolor, ijk_bytes, ijk_dtype):
+    """Return a tuple of `(color, vertex_indices, triangles)` per unique facecolor.
+    Inputs are hashable so that the partition of a mesh, which usually does not
+    change between animation frames, is only computed once."""
+    ijk = np.frombuffer(ijk_bytes, dtype=ijk_dtype).reshape(3, -1)
+    facecolor = np.array(facecolor, dtype=object)
+    partition = []
+    for color in np.unique(facecolor):
+        mask = facecolor == color
+        uniq = np.unique(ijk[:, mask])
+        mapping_ar = np.zeros(uniq.max() + 1, dtype=int)
+        mapping_ar[uniq] = np.arange(len(uniq))
+        triangles = mapping_ar[ijk[:, mask]]
+        for arr in (uniq, triangles):
+            arr.flags.writeable = False  # shared between calls
+        partition.append((color, uniq, triangles))
+    return tuple(partition)
+
+
 def subdivide_mesh_by_facecolor(trace):
     """Subdivide a mesh into a list of meshes based on facecolor"""
     facecolor = trace["facecolor"] = np.array(trace["facecolor"])
     subtraces = []
     # pylint: disable=singleton-comparison
     facecolor[facecolor == np.array(None)] = "black"
-    for color in np.unique(facecolor):
-        mask = facecolor == color
+    ijk = np.array([trace[k] for k in "ijk"])
+    partition = get_mesh_facecolor_partition(
+        tuple(facecolor.tolist()), ijk.tobytes(), ijk.dtype.str
+    )
+    for color, uniq, triangles in partition:
         new_trace = trace.copy()
-        uniq = np.unique(np.hstack([np.array(trace[k])[mask] for k in "ijk"]))
-        new_inds = np.arange(len(uniq))
-        mapping_ar = np.zeros(uniq.max() + 1, dtype=new_inds.dtype)
-        mapping_ar[uniq] = new_inds
-        for k in "ijk":
-            new_trace[k] = mapping_ar[np.array(trace[k])[mask]]
+        for k, tri in zip("ijk", triangles):
+            new_trace[k] = tri
         for k in "xyz":
-            new_trace[k] = new_trace[k][uniq]
+            new_trace[k] = np.array(new_trace[k])[uniq]
         new_trace["color"] = color
         new_trace.pop("facecolor")
         subtraces.append(new_trace)
@@ -8,8 +8,10 @@ from scipy.constants import mu_0 as MU0
 
 from magpylib._src.fields.special_cel import cel_iter
 from magpylib._src.input_checks import check_field_input
-from magpylib._src.utility import cart_to_cyl_coordinates
-from magpylib._src.utility import cyl_field_to_cart
+
+# prefactor from the paper (1e-6/20) combined with the conversion of
+#   the output to H-field (1e7/4/np.pi)
+_PREFACTOR = 1e-6 / 20 * 795774.7154594767
 
 
 # CORE
@@ -41,8 +43,9 @@ def current_circle_Hfield(
 
     Returns
     -------
-    B-field: ndarray, shape (n,3)
-        B-field generated by Loops at observer positions.
+    H-field: ndarray, shape (3,n)
+        H-field (Hr, Hphi, Hz) in cylindrical coordinates generated by Loops at
+        observer positions. Hphi is zero by symmetry.
 
     Notes
     -----
@@ -57,28 +60,48 @@ def current_circle_Hfield(
     z = z / r0
 
     # field computation from paper
-    z2 = z**2
-    x0 = z2 + (r + 1) ** 2
-    k2 = 4 * r / x0
-    q2 = (z2 + (r - 1) ** 2) / x0
+    #   in-place operations avoid allocating a new temporary for every step
+    z2 = z * z
+    x0 = r + 1
+    x0 *= x0
+    x0 += z2
+    k2 = 4 * r
+    k2 /= x0
+    q2 = r - 1
+    q2 *= q2
+    q2 += z2
+    q2 /= x0
 
     k = np.sqrt(k2)
     q = np.sqrt(q2)
     p = 1 + q
-    pf = k / np.sqrt(r) / q2 / 20 / r0 * 1e-6 * i0
+    pf = k / np.sqrt(r)
+    pf /= q2
+    pf /= r0
+    pf *= i0
+    pf *= _PREFACTOR
+
+    # input is I -> output is H-field (conversion included in _PREFACTOR)
+    #   components are written directly into the rows of the output
+    H = np.zeros((3, n5))
+    Hr, _, Hz = H
 
     # cel* part
     cc = k2 * k2
     ss = 2 * cc * q / p
-    Hr = pf * z / r * cel_iter(q, p, np.ones(n5), cc, ss, p, q)
+    Hr[:] = cel_iter(q, p, 1.0, cc, ss, p, q)
+    Hr *= pf
+    Hr *= z
+    Hr /= r
 
     # cel** part
     cc = k2 * (k2 - (q2 + 1) / r)
     ss = 2 * k2 * q * (k2 / p - p / r)
-    Hz = -pf * cel_iter(q, p, np.ones(n5), cc, ss, p, q)
+    Hz[:] = cel_iter(q, p, 1.0, cc, ss, p, q)
+    Hz *= pf
+    np.negative(Hz, out=Hz)
 
-    # input is I -> output must be H-field
-    return np.vstack((Hr, np.zeros(n5), Hz)) * 795774.7154594767  # *1e7/4/np.pi
+    return H
 
 
 def BHJM_circle(
@@ -92,49 +115,72 @@ def BHJM_circle(
     - treat special cases
     """
 
-    # allocate
-    BHJM = np.zeros_like(observers, dtype=float)
-
     check_field_input(field)
     if field in "MJ":
-        return BHJM
+        return np.zeros_like(observers, dtype=float)
 
-    r, phi, z = cart_to_cyl_coordinates(observers)
+    # cylindrical coordinates without the angle, cos(phi)=x/r and sin(phi)=y/r
+    #   are used below instead of trigonometric functions
+    x, y, z = observers.T
+    r = np.sqrt(x * x + y * y)
     r0 = np.abs(diameter / 2)
 
     # Special cases:
     # case1: loop radius is 0 -> return (0,0,0)
     mask1 = r0 == 0
     # case2: at singularity -> return (0,0,0)
-    mask2 = np.logical_and(abs(r - r0) < 1e-15 * r0, z == 0)
+    mask2 = z == 0
+    mask2 &= np.abs(r - r0) < 1e-15 * r0
     # case3: r=0
     mask3 = r == 0
+
+    # general case
+    mask5 = mask1 | mask2
+    mask5 |= mask3
+    np.logical_not(mask5, out=mask5)
+    n_general = np.count_nonzero(mask5)
+
+    # allocate - the output only needs zero-initialization when there are special
+    #   cases, otherwise all entries are written below
+    if n_general == len(mask5):  # no special cases - avoid boolean indexing copies
+        mask5 = slice(None)
+        BHJM = np.empty_like(observers, dtype=float)
+    else:
+        BHJM = np.zeros_like(observers, dtype=float)
+
+    # H->B conversion is applied to the components before they are written
+    #   to avoid a second pass over the output
+    scale = MU0 if field == "B" else 1.0
+
     if np.any(mask3):
         mask4 = mask3 * ~mask1  # only relevant if not also case1
         BHJM[mask4, 2] = (
             (r0[mask4] ** 2 / (z[mask4] ** 2 + r0[mask4] ** 2) ** (3 / 2))
             * current[mask4]
-            * 0.5
+            * (0.5 * scale)
         )
 
-    # general case
-    mask5 = ~np.logical_or(np.logical_or(mask1, mask2), mask3)
-    if np.any(mask5):
-        BHJM[mask5] = current_circle_Hfield(
+    #   special cases have no radial component, so that the transformation
+    #   to Cartesian coordinates is only required here
+    if n_general:
+        r5 = r[mask5]
+        Hr, _, Hz = current_circle_Hfield(
             r0=r0[mask5],
-            r=r[mask5],
+            r=r5,
             z=z[mask5],
             i0=current[mask5],
-        ).T
-
-    BHJM[:, 0], BHJM[:, 1] = cyl_field_to_cart(phi, BHJM[:, 0])
-
-    if field == "H":
+        )
+        Hr /= r5  # r>0 for all general cases
+        if field == "B":
+            Hr *= scale
+            Hz *= scale
+        BHJM[mask5, 0] = Hr * x[mask5]
+        BHJM[mask5, 1] = Hr * y[mask5]
+        BHJM[mask5, 2] = Hz
+
+    if field in "HB":
         return BHJM
 
-    if field == "B":
-        return BHJM * MU0
-
     raise ValueError(  # pragma: no cover
         "`output_field_type` must be one of ('B', 'H', 'M', 'J'), " f"got {field!r}"
     )
@@ -10,6 +10,20 @@ from magpylib._src.input_checks import check_field_input
 
 # pylint: disable=too-many-statements
 
+# large inputs are evaluated in blocks of this size, so that the many
+#   temporary arrays of the computation stay in the CPU cache
+_BLOCK_SIZE = 2**13
+
+_INV_4PI = 1 / (4 * np.pi)
+
+
+def _corner_distance(x2, y2, z2):
+    """Distance from squared coordinate differences, sum and square root are
+    computed in-place so that only one array is allocated per distance."""
+    dist = x2 + y2
+    dist += z2
+    return np.sqrt(dist, out=dist)
+
 
 # CORE
 def magnet_cuboid_Bfield(
@@ -63,9 +77,31 @@ def magnet_cuboid_Bfield(
 
     Cichon: IEEE Sensors Journal, vol. 19, no. 7, April 1, 2019, p.2509
     """
+    return _magnet_cuboid_field(observers, dimensions, polarizations, _INV_4PI)
+
+
+def _magnet_cuboid_field(
+    observers: np.ndarray,
+    dimensions: np.ndarray,
+    polarizations: np.ndarray,
+    scale: float,
+):
+    """Computation of `magnet_cuboid_Bfield` with the prefactor `scale` instead of
+    1/(4*pi), so that the B->H conversion does not require another pass over the output.
+    """
+    n = len(observers)
+    if n > _BLOCK_SIZE:
+        B = np.empty((n, 3))
+        for start in range(0, n, _BLOCK_SIZE):
+            block = slice(start, start + _BLOCK_SIZE)
+            B[block] = _magnet_cuboid_field(
+                observers[block], dimensions[block], polarizations[block], scale
+            )
+        return B
+
     pol_x, pol_y, pol_z = polarizations.T
     a, b, c = dimensions.T / 2
-    x, y, z = np.copy(observers).T
+    x, y, z = observers.T
 
     # avoid indeterminate forms by evaluating in bottQ4 only --------
     # basic masks
@@ -73,20 +109,20 @@ def magnet_cuboid_Bfield(
     masky = y > 0
     maskz = z > 0
 
-    # change all positions to their bottQ4 counterparts
-    x[maskx] = x[maskx] * -1
-    y[masky] = y[masky] * -1
-    z[maskz] = z[maskz] * -1
-
-    # create sign flips for position changes
-    qsigns = np.ones((len(pol_x), 3, 3))
-    qs_flipx = np.array([[1, -1, -1], [-1, 1, 1], [-1, 1, 1]])
-    qs_flipy = np.array([[1, -1, 1], [-1, 1, -1], [1, -1, 1]])
-    qs_flipz = np.array([[1, 1, -1], [1, 1, -1], [-1, -1, 1]])
-    # signs flips can be applied subsequently
-    qsigns[maskx] = qsigns[maskx] * qs_flipx
-    qsigns[masky] = qsigns[masky] * qs_flipy
-    qsigns[maskz] = qsigns[maskz] * qs_flipz
+    # change all positions to their bottQ4 counterparts (x>=0, y<=0, z<=0)
+    #   in one pass per coordinate without modifying the input
+    x = np.abs(x)
+    y = np.abs(y)
+    np.negative(y, out=y)
+    z = np.abs(z)
+    np.negative(z, out=z)
+
+    # sign flips for position changes
+    #   the flips of the off-diagonal terms are products of the flips of two
+    #   coordinates, i.e. a flip happens when only one of the two is changed
+    flip_xy = maskx ^ masky
+    flip_xz = maskx ^ maskz
+    flip_yz = masky ^ maskz
 
     # field computations --------------------------------------------
     # Note: in principle the computation for all three polarization-components can be
@@ -99,88 +135,126 @@ def magnet_cuboid_Bfield(
     ymb, ypb = y - b, y + b
     zmc, zpc = z - c, z + c
 
-    xma2, xpa2 = xma**2, xpa**2
-    ymb2, ypb2 = ymb**2, ypb**2
-    zmc2, zpc2 = zmc**2, zpc**2
+    xma2, xpa2 = xma * xma, xpa * xpa
+    ymb2, ypb2 = ymb * ymb, ypb * ypb
+    zmc2, zpc2 = zmc * zmc, zpc * zpc
 
-    mmm = np.sqrt(xma2 + ymb2 + zmc2)
-    pmp = np.sqrt(xpa2 + ymb2 + zpc2)
-    pmm = np.sqrt(xpa2 + ymb2 + zmc2)
-    mmp = np.sqrt(xma2 + ymb2 + zpc2)
-    mpm = np.sqrt(xma2 + ypb2 + zmc2)
-    ppp = np.sqrt(xpa2 + ypb2 + zpc2)
-    ppm = np.sqrt(xpa2 + ypb2 + zmc2)
-    mpp = np.sqrt(xma2 + ypb2 + zpc2)
+    # corner distances
+    mmm = _corner_distance(xma2, ymb2, zmc2)
+    pmm = _corner_distance(xpa2, ymb2, zmc2)
+    mpm = _corner_distance(xma2, ypb2, zmc2)
+    ppm = _corner_distance(xpa2, ypb2, zmc2)
+    mmp = _corner_distance(xma2, ymb2, zpc2)
+    pmp = _corner_distance(xpa2, ymb2, zpc2)
+    mpp = _corner_distance(xma2, ypb2, zpc2)
+    ppp = _corner_distance(xpa2, ypb2, zpc2)
 
-    with np.errstate(divide="ignore", invalid="ignore"):
-        ff2x = np.log((xma + mmm) * (xpa + ppm) * (xpa + pmp) * (xma + mpp)) - np.log(
-            (xpa + pmm) * (xma + mpm) * (xma + mmp) * (xpa + ppp)
-        )
-
-        ff2y = np.log(
-            (-ymb + mmm) * (-ypb + ppm) * (-ymb + pmp) * (-ypb + mpp)
-        ) - np.log((-ymb + pmm) * (-ypb + mpm) * (ymb - mmp) * (ypb - ppp))
-
-        ff2z = np.log(
-            (-zmc + mmm) * (-zmc + ppm) * (-zpc + pmp) * (-zpc + mpp)
-        ) - np.log((-zmc + pmm) * (zmc - mpm) * (-zpc + mmp) * (zpc - ppp))
-
-    ff1x = (
-        np.arctan2((ymb * zmc), (xma * mmm))
-        - np.arctan2((ymb * zmc), (xpa * pmm))
-        - np.arctan2((ypb * zmc), (xma * mpm))
-        + np.arctan2((ypb * zmc), (xpa * ppm))
-        - np.arctan2((ymb * zpc), (xma * mmp))
-        + np.arctan2((ymb * zpc), (xpa * pmp))
-        + np.arctan2((ypb * zpc), (xma * mpp))
-        - np.arctan2((ypb * zpc), (xpa * ppp))
-    )
+    # polarization components that vanish for all inputs (e.g. a polarization
+    #   along one axis) do not contribute, and their ff-terms are skipped
+    has_x, has_y, has_z = pol_x.any(), pol_y.any(), pol_z.any()
 
-    ff1y = (
-        np.arctan2((xma * zmc), (ymb * mmm))
-        - np.arctan2((xpa * zmc), (ymb * pmm))
-        - np.arctan2((xma * zmc), (ypb * mpm))
-        + np.arctan2((xpa * zmc), (ypb * ppm))
-        - np.arctan2((xma * zpc), (ymb * mmp))
-        + np.arctan2((xpa * zpc), (ymb * pmp))
-        + np.arctan2((xma * zpc), (ypb * mpp))
-        - np.arctan2((xpa * zpc), (ypb * ppp))
-    )
-
-    ff1z = (
-        np.arctan2((xma * ymb), (zmc * mmm))
-        - np.arctan2((xpa * ymb), (zmc * pmm))
-        - np.arctan2((xma * ypb), (zmc * mpm))
-        + np.arctan2((xpa * ypb), (zmc * ppm))
-        - np.arctan2((xma * ymb), (zpc * mmp))
-        + np.arctan2((xpa * ymb), (zpc * pmp))
-        + np.arctan2((xma * ypb), (zpc * mpp))
-        - np.arctan2((xpa * ypb), (zpc * ppp))
-    )
-
-    # contributions from x-polarization
-    #    the 'missing' third sign is hidden in ff1x
-    bx_pol_x = pol_x * ff1x * qsigns[:, 0, 0]
-    by_pol_x = pol_x * ff2z * qsigns[:, 0, 1]
-    bz_pol_x = pol_x * ff2y * qsigns[:, 0, 2]
-    # contributions from y-polarization
-    bx_pol_y = pol_y * ff2z * qsigns[:, 1, 0]
-    by_pol_y = pol_y * ff1y * qsigns[:, 1, 1]
-    bz_pol_y = -pol_y * ff2x * qsigns[:, 1, 2]
-    # contributions from z-polarization
-    bx_pol_z = pol_z * ff2y * qsigns[:, 2, 0]
-    by_pol_z = -pol_z * ff2x * qsigns[:, 2, 1]
-    bz_pol_z = pol_z * ff1z * qsigns[:, 2, 2]
-
-    # summing all contributions
-    bx_tot = bx_pol_x + bx_pol_y + bx_pol_z
-    by_tot = by_pol_x + by_pol_y + by_pol_z
-    bz_tot = bz_pol_x + bz_pol_y + bz_pol_z
-
-    # B = np.c_[bx_tot, by_tot, bz_tot]      # faster for 10^5 and more evaluations
-    B = np.concatenate(((bx_tot,), (by_tot,), (bz_tot,)), axis=0).T
-
-    B /= 4 * np.pi
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # log of the ratio instead of the difference of two logs, with
+        #   numerators and denominators accumulated in-place
+        if has_y or has_z:
+            ff2x = xma + mmm
+            ff2x *= xpa + ppm
+            ff2x *= xpa + pmp
+            ff2x *= xma + mpp
+            den = xpa + pmm
+            den *= xma + mpm
+            den *= xma + mmp
+            den *= xpa + ppp
+            ff2x /= den
+            np.log(ff2x, out=ff2x)
+            # apply sign flips, each ff2 term has the same flip in all contributions
+            np.negative(ff2x, out=ff2x, where=flip_yz)
+
+        if has_x or has_z:
+            ff2y = mmm - ymb
+            ff2y *= ppm - ypb
+            ff2y *= pmp - ymb
+            ff2y *= mpp - ypb
+            den = pmm - ymb
+            den *= mpm - ypb
+            den *= ymb - mmp
+            den *= ypb - ppp
+            ff2y /= den
+            np.log(ff2y, out=ff2y)
+            np.negative(ff2y, out=ff2y, where=flip_xz)
+
+        if has_x or has_y:
+            ff2z = mmm - zmc
+            ff2z *= ppm - zmc
+            ff2z *= pmp - zpc
+            ff2z *= mpp - zpc
+            den = pmm - zmc
+            den *= zmc - mpm
+            den *= mmp - zpc
+            den *= zpc - ppp
+            ff2z /= den
+            np.log(ff2z, out=ff2z)
+            np.negative(ff2z, out=ff2z, where=flip_xy)
+
+    # summing all contributions, component by component
+    #   the 'missing' third sign is hidden in ff1x
+    #   ff1 terms: the arctan2 numerators are shared by pairs of corners
+    bx_tot, by_tot, bz_tot = np.zeros((3, n))
+
+    if has_x:
+        ymb_zmc, ypb_zmc = ymb * zmc, ypb * zmc
+        ymb_zpc, ypb_zpc = ymb * zpc, ypb * zpc
+        ff1x = np.arctan2(ymb_zmc, (xma * mmm))
+        ff1x -= np.arctan2(ymb_zmc, (xpa * pmm))
+        ff1x -= np.arctan2(ypb_zmc, (xma * mpm))
+        ff1x += np.arctan2(ypb_zmc, (xpa * ppm))
+        ff1x -= np.arctan2(ymb_zpc, (xma * mmp))
+        ff1x += np.arctan2(ymb_zpc, (xpa * pmp))
+        ff1x += np.arctan2(ypb_zpc, (xma * mpp))
+        ff1x -= np.arctan2(ypb_zpc, (xpa * ppp))
+
+        bx_tot += pol_x * ff1x
+        by_tot += pol_x * ff2z
+        bz_tot += pol_x * ff2y
+
+    if has_y:
+        xma_zmc, xpa_zmc = xma * zmc, xpa * zmc
+        xma_zpc, xpa_zpc = xma * zpc, xpa * zpc
+        ff1y = np.arctan2(xma_zmc, (ymb * mmm))
+        ff1y -= np.arctan2(xpa_zmc, (ymb * pmm))
+        ff1y -= np.arctan2(xma_zmc, (ypb * mpm))
+        ff1y += np.arctan2(xpa_zmc, (ypb * ppm))
+        ff1y -= np.arctan2(xma_zpc, (ymb * mmp))
+        ff1y += np.arctan2(xpa_zpc, (ymb * pmp))
+        ff1y += np.arctan2(xma_zpc, (ypb * mpp))
+        ff1y -= np.arctan2(xpa_zpc, (ypb * ppp))
+
+        bx_tot += pol_y * ff2z
+        by_tot += pol_y * ff1y
+        bz_tot -= pol_y * ff2x
+
+    if has_z:
+        xma_ymb, xpa_ymb = xma * ymb, xpa * ymb
+        xma_ypb, xpa_ypb = xma * ypb, xpa * ypb
+        ff1z = np.arctan2(xma_ymb, (zmc * mmm))
+        ff1z -= np.arctan2(xpa_ymb, (zmc * pmm))
+        ff1z -= np.arctan2(xma_ypb, (zmc * mpm))
+        ff1z += np.arctan2(xpa_ypb, (zmc * ppm))
+        ff1z -= np.arctan2(xma_ymb, (zpc * mmp))
+        ff1z += np.arctan2(xpa_ymb, (zpc * pmp))
+        ff1z += np.arctan2(xma_ypb, (zpc * mpp))
+        ff1z -= np.arctan2(xpa_ypb, (zpc * ppp))
+
+        bx_tot += pol_z * ff2y
+        by_tot -= pol_z * ff2x
+        bz_tot += pol_z * ff1z
+
+    # write the scaled components into a C-contiguous output, which avoids
+    #   the concatenated (3,n) intermediate and a transposed result
+    B = np.empty((n, 3))
+    np.multiply(bx_tot, scale, out=B[:, 0])
+    np.multiply(by_tot, scale, out=B[:, 1])
+    np.multiply(bz_tot, scale, out=B[:, 2])
     return B
 
 
@@ -203,8 +277,27 @@ def BHJM_magnet_cuboid(
     a, b, c = np.abs(dimension.T) / 2
     x, y, z = observers.T
 
-    # allocate for output
-    BHJM = polarization.astype(float)
+    # inside-outside
+    #   signed distance to the surface and tolerance are computed once per axis
+    x_dist, y_dist, z_dist = np.abs(x) - a, np.abs(y) - b, np.abs(z) - c
+    tol_a, tol_b, tol_c = RTOL_SURFACE * a, RTOL_SURFACE * b, RTOL_SURFACE * c
+    mask_inside_x = x_dist < tol_a
+    mask_inside_y = y_dist < tol_b
+    mask_inside_z = z_dist < tol_c
+    mask_inside = mask_inside_x & mask_inside_y
+    mask_inside &= mask_inside_z
+
+    # masked assignments are skipped when all observers are inside or outside
+    n_inside = np.count_nonzero(mask_inside)
+    n_obs = len(observers)
+
+    if field in "JM":
+        if n_inside == 0:
+            return np.zeros((n_obs, 3))
+        BHJM = polarization / MU0 if field == "M" else polarization.astype(float)
+        if n_inside < n_obs:
+            BHJM[~mask_inside] = 0
+        return BHJM
 
     # SPECIAL CASE 1: polarization = (0,0,0)
     mask_pol_not_null = ~(
@@ -220,44 +313,48 @@ def BHJM_magnet_cuboid(
     #    a is e.g. EPSILON itself)
 
     # on-surface is not a special case
-    mask_surf_x = abs(x_dist := abs(x) - a) < RTOL_SURFACE * a  # on surface
-    mask_surf_y = abs(y_dist := abs(y) - b) < RTOL_SURFACE * b  # on surface
-    mask_surf_z = abs(z_dist := abs(z) - c) < RTOL_SURFACE * c  # on surface
-
-    # inside-outside
-    mask_inside_x = x_dist < RTOL_SURFACE * a
-    mask_inside_y = y_dist < RTOL_SURFACE * b
-    mask_inside_z = z_dist < RTOL_SURFACE * c
-    mask_inside = mask_inside_x & mask_inside_y & mask_inside_z
-
-    # on edge (requires on-surface and inside-outside)
-    mask_xedge = mask_surf_y & mask_surf_z & mask_inside_x
-    mask_yedge = mask_surf_x & mask_surf_z & mask_inside_y
-    mask_zedge = mask_surf_x & mask_surf_y & mask_inside_z
-    mask_not_edge = ~(mask_xedge | mask_yedge | mask_zedge)
-
-    mask_gen = mask_pol_not_null & mask_dim_not_null & mask_not_edge
-
-    if field == "J":
-        BHJM[~mask_inside] = 0
-        return BHJM
-
-    if field == "M":
-        BHJM[~mask_inside] = 0
-        return BHJM / MU0
-
-    BHJM *= 0  # return (0,0,0) for all special cases
-    BHJM[mask_gen] = magnet_cuboid_Bfield(
-        observers=observers[mask_gen],
-        dimensions=dimension[mask_gen],
-        polarizations=polarization[mask_gen],
-    )
+    mask_surf_x = np.abs(x_dist, out=x_dist) < tol_a
+    mask_surf_y = np.abs(y_dist, out=y_dist) < tol_b
+    mask_surf_z = np.abs(z_dist, out=z_dist) < tol_c
+
+    mask_gen = mask_pol_not_null
+    mask_gen &= mask_dim_not_null
+
+    # on edge (requires on-surface and inside-outside), combined in-place
+    #   an edge requires observers on two surfaces, which is rare
+    if sum(mask.any() for mask in (mask_surf_x, mask_surf_y, mask_surf_z)) > 1:
+        mask_edge = mask_surf_y & mask_surf_z
+        mask_edge &= mask_inside_x
+        mask_yedge = mask_surf_x & mask_surf_z
+        mask_yedge &= mask_inside_y
+        mask_edge |= mask_yedge
+        mask_zedge = np.logical_and(mask_surf_x, mask_surf_y, out=mask_yedge)
+        mask_zedge &= mask_inside_z
+        mask_edge |= mask_zedge
+        mask_gen &= ~mask_edge
+
+    # for H the division by MU0 is applied together with the core prefactor
+    scale = _INV_4PI if field == "B" else _INV_4PI / MU0
+    if np.all(mask_gen):
+        # no special cases, avoid masked copies of all inputs
+        BHJM = _magnet_cuboid_field(observers, dimension, polarization, scale)
+    else:
+        BHJM = np.zeros((n_obs, 3))  # return (0,0,0) for all special cases
+        BHJM[mask_gen] = _magnet_cuboid_field(
+            observers=observers[mask_gen],
+            dimensions=dimension[mask_gen],
+            polarizations=polarization[mask_gen],
+            scale=scale,
+        )
     if field == "B":
         return BHJM
 
     if field == "H":
-        BHJM[mask_inside] -= polarization[mask_inside]
-        return BHJM / MU0
+        if n_inside == n_obs:
+            BHJM -= polarization / MU0
+        elif n_inside:
+            BHJM[mask_inside] -= polarization[mask_inside] / MU0
+        return BHJM
 
     raise ValueError(  # pragma: no cover
         "`output_field_type` must be one of ('B', 'H', 'M', 'J'), " f"got {field!r}"
@@ -64,39 +64,51 @@ def BHJM_magnet_sphere(
     """
     check_field_input(field)
 
-    x, y, z = np.copy(observers.T)
-    r = np.sqrt(x**2 + y**2 + z**2)  # faster than np.linalg.norm
+    # row-wise dot product reads observers contiguously, faster than np.linalg.norm
+    r = np.sqrt(np.einsum("ij,ij->i", observers, observers))
     r_sphere = abs(diameter) / 2
 
-    # inside field & allocate
-    BHJM = polarization.astype(float)
     out = r > r_sphere
 
-    if field == "J":
-        BHJM[out] = 0.0
+    if field in "JM":
+        # masked assignment is skipped when all observers are inside or outside
+        n_out = np.count_nonzero(out)
+        if n_out == len(observers):
+            return np.zeros((n_out, 3))
+        BHJM = polarization / MU0 if field == "M" else polarization.astype(float)
+        if n_out:
+            BHJM[out] = 0.0
         return BHJM
 
-    if field == "M":
-        BHJM[out] = 0.0
-        return BHJM / MU0
-
-    BHJM *= 2 / 3
-
-    BHJM[out] = (
-        (
-            3 * np.sum(polarization[out] * observers[out], axis=1) * observers[out].T
-            - polarization[out].T * r[out] ** 2
-        )
-        / r[out] ** 5
-        * r_sphere[out] ** 3
-        / 3
-    ).T
+    # when all observers lie outside (typical for sensors), the masked copies
+    #   of all inputs and the inside field are not needed
+    all_out = np.all(out)
+    if all_out:
+        obs_out, pol_out, r_out, r_sphere_out = observers, polarization, r, r_sphere
+    else:
+        obs_out, pol_out = observers[out], polarization[out]
+        r_out, r_sphere_out = r[out], r_sphere[out]
+
+    # dipole field outside: (3*(p.o)*o - p*r^2) / r^5 * R^3/3
+    #   with the row-wise factors computed first to avoid (3,n) temporaries
+    ratio3 = (r_sphere_out / r_out) ** 3  # R^3/r^3
+    k_obs = np.einsum("ij,ij->i", pol_out, obs_out) * ratio3
+    k_obs /= r_out * r_out
+    ratio3 /= 3
+    B_out = obs_out * k_obs[:, np.newaxis] - pol_out * ratio3[:, np.newaxis]
+
+    if all_out:
+        BHJM = B_out
+    else:
+        BHJM = polarization * (2 / 3)  # inside field
+        BHJM[out] = B_out
 
     if field == "B":
         return BHJM
 
     if field == "H":
-        BHJM[~out] -= polarization[~out]
+        if not all_out:
+            BHJM[~out] -= polarization[~out]
         return BHJM / MU0
 
     raise ValueError(  # pragma: no cover
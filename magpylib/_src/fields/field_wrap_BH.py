@@ -69,6 +69,7 @@ from magpylib._src.utility import format_obj_input
 from magpylib._src.utility import format_src_inputs
 from magpylib._src.utility import get_registered_sources
 from magpylib._src.utility import has_parameter
+from magpylib._src.utility import quat_rotate
 
 
 def tile_group_property(group: list, n_pp: int, prop_name: str):
@@ -81,30 +82,51 @@ def tile_group_property(group: list, n_pp: int, prop_name: str):
     return np.repeat(out, n_pp, axis=0)
 
 
-def get_src_dict(group: list, n_pix: int, n_pp: int, poso: np.ndarray) -> dict:
-    """create dictionaries for level1 input"""
+def pad_path(path: np.ndarray, length: int) -> np.ndarray:
+    """edge-pad a path of shape (m0, k) to shape (length, k). Static paths
+    (m0=1) are broadcast without copy, the result must not be modified in-place.
+    """
+    m0 = len(path)
+    if m0 == length:
+        return path
+    if m0 == 1:
+        return np.broadcast_to(path, (length, path.shape[1]))
+    return np.pad(path, ((0, length - m0), (0, 0)), "edge")
+
+
+def get_src_dict(
+    group: list,
+    n_pix: int,
+    n_pp: int,
+    poso: np.ndarray,
+    position: np.ndarray,
+    orientation: np.ndarray,
+) -> dict:
+    """create dictionaries for level1 input
+
+    position and orientation are the contiguous group path arrays of shape
+    (lg, m, 3) and (lg, m, 4) (quaternions).
+    """
     # pylint: disable=protected-access
     # pylint: disable=too-many-return-statements
 
-    # tile up basic attributes that all sources have
+    # basic attributes that all sources have are not tiled up but given in shapes
+    #   that broadcast to (lg, m, n_pix, 3) in level1
     # position
-    poss = np.array([src._position for src in group])
-    posv = np.tile(poss, n_pix).reshape((-1, 3))
+    posv = position[:, :, np.newaxis, :]
 
     # orientation
-    rots = np.array([src._orientation.as_quat() for src in group])
-    rotv = np.tile(rots, n_pix).reshape((-1, 4))
-    rotobj = R.from_quat(rotv)
+    rotv = orientation[:, :, np.newaxis, :]
 
     # pos_obs
-    posov = np.tile(poso, (len(group), 1))
+    posov = poso.reshape(1, position.shape[1], n_pix, 3)
 
     # determine which group we are dealing with and tile up properties
 
     kwargs = {
         "position": posv,
         "observers": posov,
-        "orientation": rotobj,
+        "orientation": rotv,
     }
 
     src_props = group[0]._field_func_kwargs_ndim
@@ -136,6 +158,8 @@ def getBH_level1(
 
     Args
     ----
+    position, orientation, observers: arrays of shape (...,3), (...,4) and (...,3) that
+        broadcast against each other. Orientations are given as quaternions.
     kwargs: dict of shape (N,x) input vectors that describes the computation.
 
     Returns
@@ -144,19 +168,25 @@ def getBH_level1(
 
     """
 
-    # transform obs_pos into source CS
-    pos_rel_rot = orientation.apply(observers - position, inverse=True)
+    # transform obs_pos into source CS, skipped when all quaternions are unit
+    #   rotations (vector part is zero)
+    pos_rel_rot = observers - position
+    if np.any(orientation[..., :3]):
+        pos_rel_rot = quat_rotate(orientation, pos_rel_rot, inverse=True)
+    pos_shape = pos_rel_rot.shape
 
     # filter arguments
     if not has_parameter(field_func, "in_out"):  # in_out passed only to magnets
         kwargs.pop("in_out", None)
 
     # compute field
-    BH = field_func(field=field, observers=pos_rel_rot, **kwargs)
+    BH = field_func(field=field, observers=pos_rel_rot.reshape(-1, 3), **kwargs)
 
     # transform field back into global CS
+    #   always applied, so that non-finite field values are treated the same for
+    #   all orientations (e.g. inf becomes nan)
     if BH is not None:  # catch non-implemented field_func a level above
-        BH = orientation.apply(BH)
+        BH = quat_rotate(orientation, BH.reshape(pos_shape)).reshape(-1, 3)
 
     return BH
 
@@ -168,7 +198,7 @@ def getBH_level2(
     Info:
     -----
     - generates a 1D list of sources (collections flattened) and a 1D list of sensors from input
-    - tile all paths of static (path_length=1) objects
+    - edge-pad all paths shorter than the longest one (objects are not modified)
     - combine all sensor pixel positions for joint evaluation
     - group similar source types for joint evaluation
     - compute field and store in allocated array
@@ -239,6 +269,23 @@ def getBH_level2(
                         "An open mesh may return bad results."
                     )
 
+    # group similar source types----------------------------------------------
+    #   sources are dispatched by their field function, sources without field
+    #   function raise before any observer or path input is processed
+    field_func_groups = {}
+    for ind, src in enumerate(src_list):
+        group = field_func_groups.setdefault(
+            src.field_func, {"sources": [], "order": []}
+        )
+        group["sources"].append(src)
+        group["order"].append(ind)
+    if None in field_func_groups:
+        src = field_func_groups[None]["sources"][0]
+        raise MagpylibMissingInput(
+            f"Cannot compute {field}-field because "
+            f"`field_func` of {src} has undefined {field}-field computation."
+        )
+
     # format observers input:
     #   allow only bare sensor, collection, pos_vec or list thereof
     #   transform input into an ordered list of sensors (pos_vec->pixel)
@@ -254,11 +301,8 @@ def getBH_level2(
 
     # check which sensors have unit rotation
     #   so that they dont have to be rotated back later (performance issue)
-    #   this check is made now when sensor paths are not yet tiled.
     unitQ = np.array([0, 0, 0, 1.0])
-    unrotated_sensors = [
-        all(all(r == unitQ) for r in sens._orientation.as_quat()) for sens in sensors
-    ]
+    unrotated_sensors = [np.all(sens._quaternion == unitQ) for sens in sensors]
 
     # check which sensors have a static orientation
     #   either static sensor or translation path
@@ -266,77 +310,52 @@ def getBH_level2(
     static_sensor_rot = check_static_sensor_orient(sensors)
 
     # some important quantities -------------------------------------------------
-    obj_list = set(src_list + sensors)  # unique obj entries only !!!
     num_of_sources = len(sources)
     num_of_src_list = len(src_list)
     num_of_sensors = len(sensors)
 
     # tile up paths -------------------------------------------------------------
     #   all obj paths that are shorter than max-length are filled up with the last
-    #   position/orientation of the object (static paths)
-    path_lengths = [len(obj._position) for obj in obj_list]
-    max_path_len = max(path_lengths)
-
-    # objects to tile up and reset below
-    mask_reset = [max_path_len != pl for pl in path_lengths]
-    reset_obj = [obj for obj, mask in zip(obj_list, mask_reset) if mask]
-    reset_obj_m0 = [pl for pl, mask in zip(path_lengths, mask_reset) if mask]
-
-    if max_path_len > 1:
-        for obj, m0 in zip(reset_obj, reset_obj_m0):
-            # length to be tiled
-            m_tile = max_path_len - m0
-            # tile up position
-            tile_pos = np.tile(obj._position[-1], (m_tile, 1))
-            obj._position = np.concatenate((obj._position, tile_pos))
-            # tile up orientation
-            tile_orient = np.tile(obj._orientation.as_quat()[-1], (m_tile, 1))
-            # FUTURE use Rotation.concatenate() requires scipy>=1.8 and python 3.8
-            tile_orient = np.concatenate((obj._orientation.as_quat(), tile_orient))
-            obj._orientation = R.from_quat(tile_orient)
+    #   position/orientation of the object (static paths). This is done on local
+    #   arrays only, the objects themselves are not modified.
+    max_path_len = max(len(obj._position) for obj in src_list + sensors)
+
+    # gather path information in contiguous arrays ------------------------------
+    #   source paths with shape (L, m, 3) and (L, m, 4), orientations as quaternions,
+    #   so that groups are obtained by slicing instead of per-object attribute access
+    src_pos = np.array([pad_path(src._position, max_path_len) for src in src_list])
+    src_quat = np.array([pad_path(src._quaternion, max_path_len) for src in src_list])
+    sens_pos = [pad_path(sens._position, max_path_len) for sens in sensors]
+    sens_quat = [pad_path(sens._quaternion, max_path_len) for sens in sensors]
 
     # combine information form all sensors to generate pos_obs with-------------
     #   shape (m * concat all sens flat pixel, 3)
     #   allows sensors with different pixel shapes <- relevant?
-    poso = [
-        [
-            (
-                np.array([[0, 0, 0]])
-                if sens.pixel is None
-                else r.apply(sens.pixel.reshape(-1, 3))
-            )
-            + p
-            for r, p in zip(sens._orientation, sens._position)
-        ]
-        for sens in sensors
-    ]
+    #   all path indices of a sensor are rotated at once with shape (m, n_pix_sens, 3)
+    poso = []
+    for sens, sens_p, sens_q, unrotated in zip(
+        sensors, sens_pos, sens_quat, unrotated_sensors
+    ):
+        if sens.pixel is None:
+            pix = np.zeros((1, 1, 3))
+        elif unrotated:
+            pix = sens.pixel.reshape(1, -1, 3)
+        else:
+            pix = quat_rotate(sens_q[:, np.newaxis, :], sens.pixel.reshape(1, -1, 3))
+        poso.append(pix + sens_p[:, np.newaxis, :])
     poso = np.concatenate(poso, axis=1).reshape(-1, 3)
     n_pp = len(poso)
     n_pix = int(n_pp / max_path_len)
 
-    # group similar source types----------------------------------------------
-    field_func_groups = {}
-    for ind, src in enumerate(src_list):
-        group_key = src.field_func
-        if group_key is None:
-            raise MagpylibMissingInput(
-                f"Cannot compute {field}-field because "
-                f"`field_func` of {src} has undefined {field}-field computation."
-            )
-        if group_key not in field_func_groups:
-            field_func_groups[group_key] = {
-                "sources": [],
-                "order": [],
-            }
-        field_func_groups[group_key]["sources"].append(src)
-        field_func_groups[group_key]["order"].append(ind)
-
     # evaluate each group in one vectorized step -------------------------------
     B = np.empty((num_of_src_list, max_path_len, n_pix, 3))  # allocate B
     for field_func, group in field_func_groups.items():
         lg = len(group["sources"])
         gr = group["sources"]
-        src_dict = get_src_dict(gr, n_pix, n_pp, poso)  # compute array dict for level1
+        order = group["order"]
+        src_dict = get_src_dict(  # compute array dict for level1
+            gr, n_pix, n_pp, poso, src_pos[order], src_quat[order]
+        )
         # compute field
         B_group = getBH_level1(
             field_func=field_func, field=field, in_out=in_out, **src_dict
@@ -349,45 +368,32 @@ def getBH_level2(
         B_group = B_group.reshape(
             (lg, max_path_len, n_pix, 3)
         )  # reshape (2% slower for large arrays)
-        for gr_ind in range(lg):  # put into dedicated positions in B
-            B[group["order"][gr_ind]] = B_group[gr_ind]
+        B[order] = B_group  # put into dedicated positions in B
 
     # reshape output ----------------------------------------------------------------
     # rearrange B when there is at least one Collection with more than one source
+    #   sum up the consecutive slices of B that belong to each Collection
     if num_of_src_list > num_of_sources:
-        for src_ind, src in enumerate(sources):
-            if isinstance(src, Collection):
-                col_len = len(format_obj_input(src, allow="sources"))
-                # set B[i] to sum of slice
-                B[src_ind] = np.sum(B[src_ind : src_ind + col_len], axis=0)
-                B = np.delete(
-                    B, np.s_[src_ind + 1 : src_ind + col_len], 0
-                )  # delete remaining part of slice
+        src_lens = [
+            (
+                len(format_obj_input(src, allow="sources"))
+                if isinstance(src, Collection)
+                else 1
+            )
+            for src in sources
+        ]
+        B = np.add.reduceat(B, np.cumsum([0] + src_lens[:-1]), axis=0)
 
     # apply sensor rotations (after summation over collections to reduce rot.apply operations)
     for sens_ind, sens in enumerate(sensors):  # cycle through all sensors
         pix_slice = slice(pix_inds[sens_ind], pix_inds[sens_ind + 1])
         if not unrotated_sensors[sens_ind]:  # apply operations only to rotated sensors
-            # select part where rot is applied
-            Bpart = B[:, :, pix_slice]
-            # change shape to (P,3) for rot package
-            Bpart_orig_shape = Bpart.shape
-            Bpart_flat = np.reshape(Bpart, (-1, 3))
-            # apply sensor rotation
+            # quaternions broadcast against the B part of shape (L, m, n_pix_sens, 3)
             if static_sensor_rot[sens_ind]:  # special case: same rotation along path
-                sens_orient = sens._orientation[0]
+                sens_q = sens_quat[sens_ind][0]
             else:
-                sens_orient = R.from_quat(
-                    np.tile(  # tile for each source from list
-                        np.repeat(  # same orientation path index for all indices
-                            sens._orientation.as_quat(), pix_nums[sens_ind], axis=0
-                        ),
-                        (num_of_sources, 1),
-                    )
-                )
-            Bpart_flat_rot = sens_orient.inv().apply(Bpart_flat)
-            # overwrite Bpart in B
-            B[:, :, pix_slice] = np.reshape(Bpart_flat_rot, Bpart_orig_shape)
+                sens_q = sens_quat[sens_ind][:, np.newaxis, :]
+            B[:, :, pix_slice] = quat_rotate(sens_q, B[:, :, pix_slice], inverse=True)
         if sens.handedness == "left":
             B[..., pix_slice, 0] *= -1
 
@@ -402,11 +408,6 @@ def getBH_level2(
         Bagg = [np.expand_dims(pixel_agg_func(b, axis=2), axis=2) for b in Bsplit]
         B = np.concatenate(Bagg, axis=2)
 
-    # reset tiled objects
-    for obj, m0 in zip(reset_obj, reset_obj_m0):
-        obj._position = obj._position[:m0]
-        obj._orientation = obj._orientation[:m0]
-
     # sumup over sources
     if sumup:
         B = np.sum(B, axis=0, keepdims=True)
@@ -500,7 +501,7 @@ def getBH_dict_level2(
     kwargs["observers"] = observers
     kwargs["position"] = position
 
-    # change orientation to Rotation numpy array for tiling
+    # change orientation to quaternion array for tiling
     kwargs["orientation"] = orientation.as_quat()
 
     # evaluation vector lengths
@@ -543,9 +544,6 @@ def getBH_dict_level2(
         if val.ndim < expected_dim and not ragged_seq[key]:
             kwargs[key] = np.tile(val, (vec_len, *[1] * (expected_dim - 1)))
 
-    # change orientation back to Rotation object
-    kwargs["orientation"] = R.from_quat(kwargs["orientation"])
-
     # compute and return B
     B = getBH_level1(field=field, field_func=field_func, in_out=in_out, **kwargs)
 
@@ -137,6 +137,8 @@ def cel(kcv: np.ndarray, pv: np.ndarray, cv: np.ndarray, sv: np.ndarray) -> np.n
 def cel_iter(qc, p, g, cc, ss, em, kk):
     """
     Iterative part of Bulirsch cel algorithm
+
+    g can be a scalar (typically 1.0) to avoid allocating a constant array.
     """
     # case1: scalar input
     #   This cannot happen in core functions
@@ -144,9 +146,11 @@ def cel_iter(qc, p, g, cc, ss, em, kk):
     # case2: small input vector - loop is faster than vectorized computation
     n_input = len(qc)
     if n_input < 15:
+        g = np.broadcast_to(g, (n_input,))
         result = np.zeros(n_input)
         for i in range(n_input):
             result[i] = cel_iter0(qc[i], p[i], g[i], cc[i], ss[i], em[i], kk[i])
+        return result
 
     # case3: vectorized evaluation
     return cel_iterv(qc, p, g, cc, ss, em, kk)
@@ -192,7 +192,9 @@ def check_format_input_orientation(inp, init_format=False):
         )
     # handle None input and compute inpQ
     if inp is None:
-        inpQ = np.array((0, 0, 0, 1))
+        inpQ = np.array((0.0, 0.0, 0.0, 1.0))
+        if init_format:  # only the quaternion is needed, skip Rotation creation
+            return np.reshape(inpQ, (-1, 4))
         inp = Rotation.from_quat(inpQ)
     else:
         inpQ = inp.as_quat()
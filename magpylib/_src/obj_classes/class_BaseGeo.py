@@ -125,9 +125,11 @@ class BaseGeo(BaseTransform):
         elif len_pos < len_ori:
             pos = np.pad(pos, ((0, len_ori - len_pos), (0, 0)), "edge")
 
-        # set attributes
+        # set attributes, the Rotation object is only created when accessed
         self._position = pos
-        self._orientation = R.from_quat(oriQ)
+        self._orientation_rot = None
+        self._orientation_quat = oriQ
+        self._orientation_shared = False
 
     # properties ----------------------------------------------------
     @property
@@ -207,6 +209,9 @@ class BaseGeo(BaseTransform):
         # cannot squeeze (its a Rotation object)
         if len(self._orientation) == 1:  # single path orientation - reduce dimension
             return self._orientation[0]
+        # the full path can be modified in-place by item assignment, from now on
+        #   quaternions must be taken from the Rotation object at every use
+        self._orientation_shared = True
         return self._orientation  # return full path
 
     @orientation.setter
@@ -237,6 +242,31 @@ class BaseGeo(BaseTransform):
                 self.orientation * old_ori_pad.inv(), anchor=self._position, start=0
             )
 
+    @property
+    def _orientation(self):
+        """Orientation path as scipy Rotation object of shape (N,)."""
+        if self._orientation_rot is None:
+            self._orientation_rot = R.from_quat(self._orientation_quat)
+        return self._orientation_rot
+
+    @_orientation.setter
+    def _orientation(self, rot):
+        # the quaternion cache is reset when a new orientation path is assigned
+        self._orientation_rot = rot
+        self._orientation_quat = None
+        self._orientation_shared = False
+
+    @property
+    def _quaternion(self):
+        """Orientation path as quaternion array of shape (N,4), cached between
+        field computations unless the Rotation object has been handed out through
+        `orientation`. Must not be modified in-place."""
+        if self._orientation_shared:
+            return self._orientation.as_quat()
+        if self._orientation_quat is None:
+            self._orientation_quat = self._orientation.as_quat()
+        return self._orientation_quat
+
     @property
     def style(self):
         """
@@ -146,7 +146,7 @@ def check_static_sensor_orient(sensors):
         if len(sens._position) == 1:  # no sensor path (sensor is static)
             static_sensor_rot += [True]
         else:  # there is a sensor path
-            rot = sens.orientation.as_quat()
+            rot = sens._quaternion
             if np.all(rot == rot[0]):  # path with static orient (e.g. translation)
                 static_sensor_rot += [True]
             else:  # sensor rotation changes along path
@@ -350,6 +350,30 @@ def cyl_field_to_cart(phi, Br, Bphi=None):
     return Bx, By
 
 
+def quat_rotate(quat, vec, inverse=False):
+    """
+    rotate vectors with unit quaternions in scalar-last (x, y, z, w) format as
+    returned by scipy `Rotation.as_quat()`. Inputs are broadcast against each other.
+    quat: ndarray, shape (...,4)
+    vec: ndarray, shape (...,3)
+    """
+    ux, uy, uz, w = (quat[..., i] for i in range(4))
+    if inverse:
+        ux, uy, uz = -ux, -uy, -uz
+    vx, vy, vz = vec[..., 0], vec[..., 1], vec[..., 2]
+    out = np.empty(np.broadcast_shapes(quat.shape[:-1], vec.shape[:-1]) + (3,))
+    # v' = v + w*t + u x t, with t = 2 u x v
+    #   cross products written out, np.cross has a large overhead for small inputs
+    with np.errstate(invalid="ignore"):  # non-finite field values are passed on
+        tx = 2 * (uy * vz - uz * vy)
+        ty = 2 * (uz * vx - ux * vz)
+        tz = 2 * (ux * vy - uy * vx)
+        out[..., 0] = vx + w * tx + (uy * tz - uz * ty)
+        out[..., 1] = vy + w * ty + (uz * tx - ux * tz)
+        out[..., 2] = vz + w * tz + (ux * ty - uy * tx)
+    return out
+
+
 def rec_obj_remover(parent, child):
     """remove known child from parent collection"""
     # pylint: disable=protected-access
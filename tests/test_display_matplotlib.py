@@ -458,6 +458,45 @@ def test_mpl_animation():
     assert isinstance(anim, matplotlib.animation.FuncAnimation)
 
 
+def test_mpl_animation_update_artists():
+    """test that animation frames only update the artists of moving objects"""
+    c = magpy.magnet.Cuboid(polarization=(0, 1, 0), dimension=(1, 1, 1))
+    c.position = [[i, 0, 0] for i in range(1, 4)]
+    cyl = magpy.magnet.Cylinder(polarization=(0, 0, 1), dimension=(1, 1))
+    anim = magpy.show(
+        c, cyl, backend="matplotlib", animation=True, return_animation=True
+    )
+    # pylint: disable=protected-access
+    anim._draw_was_started = True  # avoid mpl test warning
+    anim._func(0)
+    ax = anim._fig.axes[0]
+    artists = list(ax.get_children())
+    changed = anim._func(1)
+    assert {type(a).__name__ for a in changed} == {"Poly3DCollection", "Line3D"}
+    assert all(a.axes is ax for a in changed)
+    assert len(ax.get_children()) == len(artists)
+    assert all(a in artists for a in ax.lines)
+    plt.close(anim._fig)
+
+    # 2D subplot, the current frame marker must keep its color
+    sens = magpy.Sensor()
+    anim = magpy.show(
+        {"objects": [c, sens], "output": "Bx"},
+        backend="matplotlib",
+        animation=True,
+        return_animation=True,
+    )
+    anim._draw_was_started = True
+    ax = anim._fig.axes[0]
+    colors = []
+    for ind in range(3):
+        anim._func(ind)
+        (marker,) = [a for a in ax.collections if type(a).__name__ == "PathCollection"]
+        colors.append(tuple(marker.get_facecolor()[0]))
+    assert colors[0] == colors[1] == colors[2]
+    plt.close(anim._fig)
+
+
 def test_subplots():
     """test subplots"""
     sensor = magpy.Sensor(
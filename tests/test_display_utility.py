@@ -8,7 +8,9 @@ import pyvista
 
 import magpylib as magpy
 from magpylib._src.display.traces_utility import draw_arrow_from_vertices
+from magpylib._src.display.traces_utility import get_mesh_facecolor_partition
 from magpylib._src.display.traces_utility import merge_scatter3d
+from magpylib._src.display.traces_utility import subdivide_mesh_by_facecolor
 from magpylib._src.exceptions import MagpylibBadUserInput
 
 
@@ -101,3 +103,25 @@ def test_merge_scatter3d():
 
     merge_scatter3d(*get_traces(1))
     merge_scatter3d(*get_traces(3))
+
+
+def test_subdivide_mesh_by_facecolor():
+    """test mesh subdivision and caching of the facecolor partition"""
+    trace = magpy.graphics.model3d.make_Cuboid(position=(1, 2, 3))["kwargs"]
+    facecolor = ["red"] * 4 + [None] * 8
+
+    get_mesh_facecolor_partition.cache_clear()
+    for pos in [(0, 0, 0), (1, 0, 0)]:
+        tr = {**trace, "facecolor": facecolor}
+        tr["x"] = np.array(tr["x"]) + pos[0]
+        subtraces = subdivide_mesh_by_facecolor(tr)
+    # pylint: disable=no-value-for-parameter
+    # (false positive, pylint takes `cache_info` for a call of the cached function)
+    assert get_mesh_facecolor_partition.cache_info().hits == 1
+
+    assert [t["color"] for t in subtraces] == ["black", "red"]
+    for t in subtraces:
+        assert "facecolor" not in t
+        tri = np.array([t[k] for k in "ijk"]).T
+        assert tri.max() == len(t["x"]) - 1
+    np.testing.assert_allclose(subtraces[1]["x"].min(), np.min(trace["x"]) + 1)
@@ -4,6 +4,7 @@ import numpy as np
 
 from magpylib._src.fields.special_cel import cel
 from magpylib._src.fields.special_cel import cel0
+from magpylib._src.fields.special_cel import cel_iter
 from magpylib._src.fields.special_cel import celv
 from magpylib._src.fields.special_el3 import el3
 from magpylib._src.fields.special_el3 import el3_angle
@@ -118,3 +119,19 @@ def test_cels():
 
     np.testing.assert_allclose(res0, res1)
     np.testing.assert_allclose(res1, res2)
+
+
+def test_cel_iter_scalar_g():
+    """
+    test that cel_iter gives the same result for a scalar g as for an array,
+    in the loop and in the vectorized branch
+    """
+    for N in [5, 50]:
+        q = np.random.rand(N) * 0.9 + 0.05
+        p = 1 + q
+        cc = (np.random.rand(N) - 0.5) * 10
+        ss = (np.random.rand(N) - 0.5) * 10
+
+        res0 = cel_iter(q, p, np.ones(N), cc, ss, p, q)
+        res1 = cel_iter(q, p, 1.0, cc, ss, p, q)
+        np.testing.assert_allclose(res0, res1, rtol=0, atol=0)
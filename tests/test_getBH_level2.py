@@ -161,9 +161,7 @@ def test_getB_level2_input_path():
 
 
 def test_path_tile():
-    """Test if auto-tiled paths of objects will properly be reset
-    in getB_level2 before returning
-    """
+    """Test that auto-tiled paths of objects are not modified by getB_level2"""
     pm1 = magpy.magnet.Cuboid(polarization=(11, 22, 33), dimension=(1, 2, 3))
     pm2 = magpy.magnet.Cuboid(polarization=(11, 22, 33), dimension=(1, 2, 3))
     poz = np.linspace((10 / 33, 10 / 33, 10 / 33), (10, 10, 10), 33)
@@ -175,8 +173,16 @@ def test_path_tile():
     path2p = pm2.position
     path2r = pm2.orientation
 
+    # pylint: disable=protected-access
+    attrs = [(pm, pm._position, pm._orientation) for pm in (pm1, pm2)]
+
     _ = magpy.getB([pm1, pm2], [0, 0, 0])
 
+    # paths are tiled locally without touching the objects
+    for pm, pos, ori in attrs:
+        assert pm._position is pos
+        assert pm._orientation is ori
+
     np.testing.assert_array_equal(
         path1p,
         pm1.position,
@@ -382,6 +388,33 @@ def test_superposition_vs_tiling():
     np.testing.assert_allclose(superposed_B, collection_B)
 
 
+def test_group_single_field_func_call(monkeypatch):
+    """sources with the same field function must be evaluated in one batched call"""
+    # pylint: disable=protected-access
+    calls = []
+    field_func = magpy.current.Circle._field_func
+
+    def counting_field_func(**kwargs):
+        calls.append(len(kwargs["observers"]))
+        return field_func(**kwargs)
+
+    monkeypatch.setattr(
+        magpy.current.Circle, "_field_func", staticmethod(counting_field_func)
+    )
+    loops = [
+        magpy.current.Circle(current=i + 1, diameter=i + 1, position=(0, 0, i))
+        for i in range(5)
+    ]
+    loops[0].position = [(0, 0, -1), (0, 0, 0), (0, 0, 1), (0, 0, 2)]
+    obs = [(1, 2, 3), (2, 3, 4), (3, 4, 5)]
+
+    B = magpy.getB(loops, obs)
+    assert calls == [5 * 4 * 3]
+
+    for loop, B_loop in zip(loops, B):
+        np.testing.assert_allclose(B_loop, np.broadcast_to(loop.getB(obs), (4, 3, 3)))
+
+
 def test_squeeze_sumup():
     """make sure that sumup does not lead to false output shape"""
 
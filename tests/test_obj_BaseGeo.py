@@ -632,3 +632,47 @@ def test_unset_describe():
 
     for o in objs:
         o.describe()
+
+
+def test_quaternion_cache():
+    """cached quaternions must follow every change of the orientation path"""
+    # pylint: disable=protected-access
+    src = magpy.magnet.Cuboid(polarization=(1, 2, 3), dimension=(1, 2, 3))
+    pos = [(1, 2, 3), (2, 3, 4)]
+    B0 = src.getB(pos)
+
+    src.rotate_from_angax(45, "z")
+    np.testing.assert_allclose(src._quaternion, src._orientation.as_quat())
+    B1 = src.getB(pos)
+    assert not np.allclose(B0, B1)
+
+    src.orientation = None
+    np.testing.assert_allclose(src._quaternion, [[0, 0, 0, 1]])
+    np.testing.assert_allclose(src.getB(pos), B0)
+
+    src.position = [(0, 0, 0)] * 3
+    assert src._quaternion.shape == (3, 4)
+
+    # in-place modification of the orientation path
+    src = magpy.magnet.Cuboid(
+        polarization=(0, 0, 1), dimension=(1, 1, 1), position=[(0, 0, 0)] * 2
+    )
+    B0 = src.getB((1, 2, 3))
+    ori = src.orientation
+    ori[1] = R.from_euler("x", 90, degrees=True)
+    B1 = src.getB((1, 2, 3))
+    np.testing.assert_allclose(B1[0], B0[0])
+    np.testing.assert_allclose(B1[1], [-0.00065, 0.00022, -0.00195], atol=1e-5)
+
+
+def test_lazy_orientation_init():
+    """the Rotation object of a new object is only created when accessed"""
+    # pylint: disable=protected-access
+    sens = magpy.Sensor(position=[(0, 0, 0), (1, 0, 0)])
+    assert sens._orientation_rot is None
+    np.testing.assert_allclose(sens._quaternion, [[0, 0, 0, 1]] * 2)
+    magpy.getB(magpy.magnet.Sphere(polarization=(1, 2, 3), diameter=1), sens)
+    assert sens._orientation_rot is None
+
+    np.testing.assert_allclose(sens.orientation.as_quat(), [[0, 0, 0, 1]] * 2)
+    assert sens._orientation_rot is not None
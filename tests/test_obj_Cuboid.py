@@ -4,6 +4,7 @@ import pickle
 import numpy as np
 
 import magpylib as magpy
+from magpylib._src.fields import field_BH_cuboid
 from magpylib._src.fields.field_BH_cuboid import BHJM_magnet_cuboid
 from magpylib._src.obj_classes.class_Sensor import Sensor
 
@@ -110,6 +111,44 @@ def test_cuboid_object_vs_lib():
     np.testing.assert_allclose(H0[0], H1)
 
 
+def test_cuboid_block_evaluation(monkeypatch):
+    """evaluation of large inputs in blocks gives the same result, and skipped
+    terms of vanishing polarization components do not change the field"""
+    rng = np.random.default_rng(0)
+    obs = rng.random((20, 3)) * 3 - 1.5
+    dim = rng.random((20, 3)) + 0.5
+    pol = rng.random((20, 3)) - 0.5
+    B0 = field_BH_cuboid.magnet_cuboid_Bfield(obs, dim, pol)
+
+    monkeypatch.setattr(field_BH_cuboid, "_BLOCK_SIZE", 3)
+    B1 = field_BH_cuboid.magnet_cuboid_Bfield(obs, dim, pol)
+    np.testing.assert_array_equal(B0, B1)
+
+    B2 = sum(
+        field_BH_cuboid.magnet_cuboid_Bfield(obs, dim, pol * np.eye(3)[i])
+        for i in range(3)
+    )
+    np.testing.assert_allclose(B0, B2, rtol=1e-12, atol=1e-15)
+
+
+def test_cuboid_special_cases_batch():
+    """edge observers return zero B-field, other rows are not affected by them"""
+    dim = np.array([(1, 2, 3)] * 4)
+    pol = np.array([(0.1, 0.2, 0.3)] * 4)
+    obs = np.array([(0.5, 1, 0), (0.5, 0, 0), (1, 2, 3), (0.5, 1, 1.5)])
+    for field in "BH":
+        F0 = BHJM_magnet_cuboid(
+            field=field, observers=obs, polarization=pol, dimension=dim
+        )
+        if field == "B":
+            np.testing.assert_array_equal(F0[[0, 3]], 0)
+        assert np.all(np.isfinite(F0))
+        F1 = BHJM_magnet_cuboid(
+            field=field, observers=obs[1:3], polarization=pol[1:3], dimension=dim[1:3]
+        )
+        np.testing.assert_allclose(F0[1:3], F1)
+
+
 def test_getM():
     """getM test"""
     m0 = (0, 0, 0)
@@ -101,3 +101,18 @@ def test_sphere_object_vs_lib():
     B2 = src.getB(pos)
 
     np.testing.assert_allclose(B1, B2)
+
+
+def test_sphere_all_outside():
+    """all-outside evaluation must match evaluation with inside observers"""
+    pol = np.array([(1, 2, 3)] * 3)
+    dia = np.array([1, 1, 1])
+    pos = np.array([(1, 2, 3), (-2, 0.5, 1), (0.1, 0.2, 0.3)])
+    for field in "BH":
+        F1 = BHJM_magnet_sphere(
+            field=field, observers=pos, polarization=pol, diameter=dia
+        )
+        F2 = BHJM_magnet_sphere(
+            field=field, observers=pos[:2], polarization=pol[:2], diameter=dia[:2]
+        )
+        np.testing.assert_allclose(F1[:2], F2)
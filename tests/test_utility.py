@@ -1,10 +1,12 @@
 import numpy as np
 import pytest
+from scipy.spatial.transform import Rotation as R
 
 import magpylib as magpy
 from magpylib._src.utility import add_iteration_suffix
 from magpylib._src.utility import check_duplicates
 from magpylib._src.utility import filter_objects
+from magpylib._src.utility import quat_rotate
 
 
 def test_duplicates():
@@ -86,3 +88,13 @@ def test_format_getBH_class_inputs():
 def test_add_iteration_suffix(name, expected):
     """check if iteration suffix works correctly"""
     assert add_iteration_suffix(name) == expected
+
+
+def test_quat_rotate():
+    """quaternion rotation must match scipy Rotation.apply, also when broadcasting"""
+    rots = R.from_rotvec(np.random.default_rng(0).normal(size=(5, 3)))
+    vecs = np.random.default_rng(1).normal(size=(5, 7, 3))
+    quats = rots.as_quat()[:, np.newaxis, :]
+    for inverse in (False, True):
+        expected = np.array([r.apply(v, inverse=inverse) for r, v in zip(rots, vecs)])
+        np.testing.assert_allclose(quat_rotate(quats, vecs, inverse=inverse), expected)